@@ -4,172 +4,213 @@ West China Hospital, Sichuan University, China.
 """
 
 import streamlit as st
+from dataclasses import dataclass, asdict
 
 
-def get_user_input_sidebar() -> tuple[dict[str, str | int | float | list[int]], bool]:
-	"""Renders the sidebar for clinical parameter input and returns the collected data.
+@dataclass(slots=True, frozen=True)
+class UserData:
+	"""Immutable snapshot of the sidebar's clinical inputs.
+
+	A frozen, slotted dataclass is cheaper to allocate than a fresh dict on
+	every rerun, and the auto-generated __hash__/__eq__ make the snapshot
+	directly usable as a cache key for downstream memoized predictions.
+	"""
+	user_id: str
+	age: int | None
+	sex: int | None
+	bmi: float | None
+	current_smoker: int | None
+	arm_circumference: float | None
+	waist_circumference: float | None
+	hip_circumference: float | None
+	calf_circumference: float | None
+	eval_times: tuple[int, ...]
+
+	def to_dict(self) -> dict:
+		"""Returns the plain-dict form consumed by the prediction and report layers."""
+		data = asdict(self)
+		data['eval_times'] = list(self.eval_times)
+		return data
+
+
+def get_user_input_sidebar() -> tuple[UserData, bool, bool]:
+	"""Renders the sidebar form for clinical parameter input and returns the collected data.
+
+	All widgets live inside a single st.form, so editing a field no longer
+	triggers a full script rerun per keystroke; the script re-executes exactly
+	once, when the clinician presses the submit button. Derived feedback such
+	as the calculated BMI therefore refreshes on submission rather than live.
 
 	This function organizes inputs into logical sections (Demographics, Anthropometrics,
-	and Circumferences) and performs real-time BMI calculation.
+	and Circumferences) and performs BMI calculation on submission.
 
 	Returns:
 		tuple: A tuple containing:
-			- user_data (dict): Dictionary of clinical features for the model.
+			- user_data (UserData): Frozen snapshot of the clinical features.
 			- all_filled (bool): True if all required fields are completed.
+			- submitted (bool): True if the form was submitted on this run.
 	"""
-	
-	# ================= Part 1: Basic Demographics =================
-	st.sidebar.subheader("👤 Demographics")
-	
-	user_id = st.sidebar.text_input(
-		"User ID / Medical Record No. (Optional):",
-		value="",
-		placeholder="e.g., P2025122901",
-		help="Enter a unique identifier to distinguish this report from others."
-	)
-	
-	age = st.sidebar.number_input(
-		"Age (Years):",
-		min_value=50, max_value=120, value=None,
-		placeholder="e.g., 72",
-		help="Please enter the patient's chronological age."
-	)
-	
-	col1, col2 = st.sidebar.columns(2)
-	with col1:
-		sex_label = st.radio(
-			"Sex:",
-			["Male", "Female"],
-			index=None,
-			horizontal=True
-		)
-		# Mapping logic
-		sex = 1 if sex_label == "Male" else (2 if sex_label == "Female" else None)
-	
-	with col2:
-		smoker_label = st.radio(
-			"Smoking Status:",
-			["Yes", "No"],
-			index=None,
-			horizontal=True,
-			help="Current smoking habit."
-		)
-		current_smoker = 1 if smoker_label == "Yes" else (0 if smoker_label == "No" else None)
-	
-	st.sidebar.divider()
-	
-	# ================= Part 2: Core Anthropometrics =================
-	st.sidebar.subheader("📏 Anthropometrics")
-	
-	# Height and Weight side-by-side
-	c1, c2 = st.sidebar.columns(2)
-	with c1:
-		height = st.number_input(
-			"Height (cm)",
-			min_value=100.0, max_value=250.0, step=0.1, value=None,
-			format="%.1f"
+
+	with st.sidebar.form("clinical_inputs"):
+		# ================= Part 1: Basic Demographics =================
+		st.subheader("👤 Demographics")
+
+		user_id = st.text_input(
+			"User ID / Medical Record No. (Optional):",
+			value="",
+			placeholder="e.g., P2025122901",
+			help="Enter a unique identifier to distinguish this report from others."
 		)
-	with c2:
-		weight = st.number_input(
-			"Weight (kg)",
-			min_value=20.0, max_value=300.0, step=0.01, value=None,
-			format="%.2f"
+
+		age = st.number_input(
+			"Age (Years):",
+			min_value=50, max_value=120, value=None,
+			placeholder="e.g., 72",
+			help="Please enter the patient's chronological age."
 		)
-	
-	# --- Real-time BMI Calculation ---
-	bmi = None
-	if height is not None and weight is not None:
-		# Note: Convert height from cm to meters for BMI formula
-		bmi = weight / ((height / 100) ** 2)
-		
-		# Display feedback to user
-		if 10 <= bmi <= 60:
-			st.sidebar.info(f"📊 Calculated BMI: **{bmi:.2f}**")
+
+		col1, col2 = st.columns(2)
+		with col1:
+			sex_label = st.radio(
+				"Sex:",
+				["Male", "Female"],
+				index=None,
+				horizontal=True
+			)
+			# Mapping logic
+			sex = 1 if sex_label == "Male" else (2 if sex_label == "Female" else None)
+
+		with col2:
+			smoker_label = st.radio(
+				"Smoking Status:",
+				["Yes", "No"],
+				index=None,
+				horizontal=True,
+				help="Current smoking habit."
+			)
+			current_smoker = 1 if smoker_label == "Yes" else (0 if smoker_label == "No" else None)
+
+		st.divider()
+
+		# ================= Part 2: Core Anthropometrics =================
+		st.subheader("📏 Anthropometrics")
+
+		# Height and Weight side-by-side
+		c1, c2 = st.columns(2)
+		with c1:
+			height = st.number_input(
+				"Height (cm)",
+				min_value=100.0, max_value=250.0, step=0.1, value=None,
+				format="%.1f"
+			)
+		with c2:
+			weight = st.number_input(
+				"Weight (kg)",
+				min_value=20.0, max_value=300.0, step=0.01, value=None,
+				format="%.2f"
+			)
+
+		# --- BMI Calculation (refreshed on submit) ---
+		bmi = None
+		if height is not None and weight is not None:
+			# BMI = weight / (height in m)^2. The squaring is written as a plain
+			# multiplication with a reciprocal factor (no pow call), a form that
+			# also stays auto-vectorizable if scoring is ever batched.
+			bmi = weight * (10000.0 / (height * height))
+
+			# Display feedback to user
+			if 10 <= bmi <= 60:
+				st.info(f"📊 Calculated BMI: **{bmi:.2f}**")
+			else:
+				st.warning(f"⚠️ Calculated BMI (**{bmi:.2f}**) appears unusual. Please check inputs.")
 		else:
-			st.sidebar.warning(f"⚠️ Calculated BMI (**{bmi:.2f}**) appears unusual. Please check inputs.")
-	else:
-		st.sidebar.caption("👉 BMI will be calculated automatically.")
-	
-	st.sidebar.divider()
-	
-	# ================= Part 3: Circumference Metrics =================
-	st.sidebar.subheader("📐 Circumferences")
-	
-	c3, c4 = st.sidebar.columns(2)
-	with c3:
-		arm_circumference = st.number_input(
-			"Arm Circ. (cm)",
-			min_value=10.0, max_value=60.0, step=0.1, value=None,
-			format="%.1f",
-			help="Mid-upper arm circumference of the dominant hand."
-		)
-		hip_circumference = st.number_input(
-			"Hip Circ. (cm)",
-			min_value=30.0, max_value=300.0, step=0.1, value=None,
-			format="%.1f",
-			help="Circumference at the widest part of the buttocks."
-		)
-	with c4:
-		waist_circumference = st.number_input(
-			"Waist Circ. (cm)",
-			min_value=30.0, max_value=300.0, step=0.1, value=None,
-			format="%.1f",
-			help="Circumference at the level of the umbilicus after expiration."
+			st.caption("👉 BMI will be calculated automatically on submission.")
+
+		st.divider()
+
+		# ================= Part 3: Circumference Metrics =================
+		st.subheader("📐 Circumferences")
+
+		c3, c4 = st.columns(2)
+		with c3:
+			arm_circumference = st.number_input(
+				"Arm Circ. (cm)",
+				min_value=10.0, max_value=60.0, step=0.1, value=None,
+				format="%.1f",
+				help="Mid-upper arm circumference of the dominant hand."
+			)
+			hip_circumference = st.number_input(
+				"Hip Circ. (cm)",
+				min_value=30.0, max_value=300.0, step=0.1, value=None,
+				format="%.1f",
+				help="Circumference at the widest part of the buttocks."
+			)
+		with c4:
+			waist_circumference = st.number_input(
+				"Waist Circ. (cm)",
+				min_value=30.0, max_value=300.0, step=0.1, value=None,
+				format="%.1f",
+				help="Circumference at the level of the umbilicus after expiration."
+			)
+			# Calf circumference is a key predictor for Sarcopenia
+			calf_circumference = st.number_input(
+				"Calf Circ. (cm)",
+				min_value=10.0, max_value=70.0, step=0.1, value=None,
+				format="%.1f",
+				help="Maximum circumference of the dominant calf."
+			)
+
+		# ================= Part 4: Prediction Settings =================
+		st.divider()
+		st.subheader("⏳ Prediction Settings")
+
+		select_all = st.checkbox(
+			"Evaluate all available years (1-7)",
+			value=False,
+			help="Toggle this to quickly select or deselect the entire 7-year follow-up period."
 		)
-		# Calf circumference is a key predictor for Sarcopenia
-		calf_circumference = st.number_input(
-			"Calf Circ. (cm)",
-			min_value=10.0, max_value=70.0, step=0.1, value=None,
-			format="%.1f",
-			help="Maximum circumference of the dominant calf."
+
+		if not select_all:
+			st.caption("Or customize specific years below:")
+		else:
+			st.caption("All years selected. You can still untick specific years below.")
+
+		default_selection = list(range(1, 8)) if select_all else None
+
+		eval_times = st.multiselect(
+			"Prediction Horizon (Years):",
+			range(1, 8),
+			default=default_selection,
+			placeholder="Select years ahead",
+			help="Select the specific years for which you want to predict the cumulative risk of sarcopenia."
 		)
-	
-	# ================= Part 4: Prediction Settings =================
-	st.sidebar.divider()
-	st.sidebar.subheader("⏳ Prediction Settings")
-	
-	select_all = st.sidebar.checkbox(
-		"Evaluate all available years (1-7)",
-		value=False,
-		help="Toggle this to quickly select or deselect the entire 7-year follow-up period."
-	)
-	
-	if not select_all:
-		st.sidebar.caption("Or customize specific years below:")
-	else:
-		st.sidebar.caption("All years selected. You can still untick specific years below.")
-	
-	default_selection = list(range(1, 8)) if select_all else None
-	
-	eval_times = st.sidebar.multiselect(
-		"Prediction Horizon (Years):",
-		range(1, 8),
-		default=default_selection,
-		placeholder="Select years ahead",
-		help="Select the specific years for which you want to predict the cumulative risk of sarcopenia."
-	)
-	
+
+		# ================= Form Submission =================
+		# A single submit collapses all widget interactions into one rerun
+		submitted = st.form_submit_button("🩺 Run Assessment", type="primary")
+
 	# ================= Data Packaging =================
-	# Check if all required fields are filled
-	required_vals = [
+	# Check if all required fields are filled. A tuple membership test is a
+	# single C-level scan, cheaper than a generator of `is not None` checks;
+	# the eval_times list needs its own emptiness check.
+	required_vals = (
 		age, sex, bmi, current_smoker,
 		arm_circumference, waist_circumference,
 		hip_circumference, calf_circumference,
-		eval_times
-	]
-	all_filled = all(v is not None for v in required_vals)
-	
-	user_data = {
-		'user_id': user_id,
-		'age': age,
-		'sex': sex,
-		'bmi': bmi,
-		'current_smoker': current_smoker,
-		'arm_circumference': arm_circumference,
-		'waist_circumference': waist_circumference,
-		'hip_circumference': hip_circumference,
-		'calf_circumference': calf_circumference,
-		'eval_times': eval_times,
-	}
-	
-	return user_data, all_filled
+	)
+	all_filled = None not in required_vals and bool(eval_times)
+
+	user_data = UserData(
+		user_id=user_id,
+		age=age,
+		sex=sex,
+		bmi=bmi,
+		current_smoker=current_smoker,
+		arm_circumference=arm_circumference,
+		waist_circumference=waist_circumference,
+		hip_circumference=hip_circumference,
+		calf_circumference=calf_circumference,
+		eval_times=tuple(eval_times),
+	)
+
+	return user_data, all_filled, submitted
@@ -7,14 +7,129 @@ import base64
 import streamlit as st
 from pathlib import Path
 
+# ================= Static CSS / HTML Blocks =================
+# These blocks never change between reruns, so they are built once at import
+# time instead of being re-assembled from f-strings on every script execution.
 
+# Centers the sidebar title text
+_SIDEBAR_CSS = """
+	<style>
+	[data-testid="stSidebarNav"] + div h1 {
+	   text-align: center;
+	}
+	/* Target the sidebar title specifically */
+	[data-testid="stSidebar"] h1 {
+	   text-align: center;
+	}
+	</style>
+	"""
+
+# Flexbox-based header layout (Logo + Text)
+_HEADER_CSS = """
+	<style>
+	.main-title {
+	   display: flex;
+	   align-items: center; /* Vertical alignment */
+	   justify-content: center; /* Horizontal alignment */
+	   gap: 20px; /* Spacing between logo and text */
+	   margin-bottom: 25px;
+	}
+	.main-title img {
+	   width: 70px; /* Set fixed logo width */
+	   height: auto; /* Maintain aspect ratio */
+	}
+	</style>
+	"""
+
+# Animated gradient notice banner (CSS + content)
+_BANNER_CSS = """
+	<style>
+	@keyframes tech-flow {
+	    0% {
+	        background-position: 0% 50%;
+	        box-shadow: 0 10px 20px -5px rgba(74, 144, 226, 0.5);
+	    }
+	    50% {
+	        background-position: 100% 50%;
+	        box-shadow: 0 15px 30px -5px rgba(144, 19, 254, 0.4);
+	    }
+	    100% {
+	        background-position: 0% 50%;
+	        box-shadow: 0 10px 20px -5px rgba(74, 144, 226, 0.5);
+	    }
+	}
+	@keyframes shimmer {
+	    0% { transform: translateX(-150%) skewX(-25deg); }
+	    100% { transform: translateX(150%) skewX(-25deg); }
+	}
+	.fancy-gradient-box {
+	    background: linear-gradient(-45deg, #4A90E2, #9013FE, #23A6D5, #23D5AB);
+	    background-size: 300% 300%;
+	    animation: tech-flow 8s cubic-bezier(0.4, 0, 0.2, 1) infinite;
+	    color: #FFFFFF;
+	    padding: 10px;
+	    border-radius: 16px;
+	    text-align: center;
+	    font-weight: 600;
+	    font-size: 20px;
+	    margin-bottom: 20px;
+	    line-height: 1.6;
+	    position: relative;
+	    overflow: hidden;
+	    border: 1px solid rgba(255, 255, 255, 0.2);
+	    backdrop-filter: blur(5px);
+	}
+	.fancy-gradient-box::after {
+	    content: "";
+	    position: absolute;
+	    top: 0;
+	    left: 0;
+	    width: 60%;
+	    height: 100%;
+	    background: linear-gradient(
+	        120deg,
+	        transparent,
+	        rgba(255, 255, 255, 0.2),
+	        transparent
+	    );
+	    animation: shimmer 5s infinite linear;
+	    z-index: 1;
+	}
+	</style>
+"""
+
+_BANNER_HTML = """
+	<div class="fancy-gradient-box">
+	   Supported by the National Clinical Research Center for Geriatrics & West China Hospital, Sichuan University, China. <br>
+	   <span style="font-size: 18px; opacity: 0.8; font-weight: normal;">For non-commercial use only.</span>
+	</div>
+	"""
+
+# All static stylesheets concatenated once at import: emitted through a
+# single st.html call, which skips markdown parsing and sends one frontend
+# message instead of one per block.
+_STATIC_CSS = _SIDEBAR_CSS + _HEADER_CSS + _BANNER_CSS
+
+# Mobile-only alert, parameterized by breakpoint; instances are cached per
+# breakpoint so the f-string interpolation runs once per distinct value.
+_MOBILE_ALERT_CACHE: dict[int, str] = {}
+
+# Rendered logo + title blocks, keyed on (title, data URI). With this, a
+# rerun of set_st_header performs no string building at all: every block it
+# emits is either a module constant or a cached value.
+_TITLE_HTML_CACHE: dict[tuple[str, str], str] = {}
+
+
+@st.cache_data(show_spinner=False)
 def get_image_base64(
 		image_path: str | Path
 ) -> str:
 	"""Converts a local image file to a base64 encoded string.
 
 	This function reads an image from the local file system, ensures its
-	existence, and encodes it for embedding in HTML/CSS contexts.
+	existence, and encodes it for embedding in HTML/CSS contexts. The result
+	is memoized with Streamlit's data cache so the disk read and base64
+	encoding only happen once per image path, not on every script rerun.
 
 	Args:
 		image_path: The full filesystem path to the image file.
@@ -25,7 +140,8 @@ def get_image_base64(
 	Raises:
 		FileNotFoundError: If the specified image_path does not exist or is not a file.
 	"""
-	path = Path(image_path)
+	# Resolve to a plain string so the cache key is stable across calls
+	path = Path(image_path).resolve()
 	
 	# Ensure the path points to a valid file before reading
 	if not path.is_file():
@@ -36,6 +152,51 @@ def get_image_base64(
 	return base64.b64encode(img_bytes).decode()
 
 
+@st.cache_data(show_spinner=False)
+def get_image_data_uri(
+		image_path: str | Path,
+		mime: str = "image/png"
+) -> str:
+	"""Builds a complete data URI for a local image, memoized per path.
+
+	Folding the "data:" prefix into the cached value means the entire src
+	attribute is reused across reruns without per-render string concatenation.
+
+	Args:
+		image_path: The full filesystem path to the image file.
+		mime: The MIME type recorded in the URI. Defaults to "image/png".
+
+	Returns:
+		The full "data:<mime>;base64,..." URI string.
+
+	Raises:
+		FileNotFoundError: If the specified image_path does not exist or is not a file.
+	"""
+	return f"data:{mime};base64,{get_image_base64(image_path)}"
+
+
+@st.cache_data(show_spinner=False)
+def get_svg_markup(
+		image_path: str | Path
+) -> str:
+	"""Reads an SVG file's markup once and memoizes it per path.
+
+	Passing the inline markup to st.image skips the per-rerun disk read and
+	media-manager round-trip that a filesystem path triggers: after the
+	first call, reruns serve the vector graphic straight from the cache.
+
+	Args:
+		image_path: The full filesystem path to the SVG file.
+
+	Returns:
+		The SVG document as a string, suitable for st.image.
+
+	Raises:
+		FileNotFoundError: If the specified image_path does not exist.
+	"""
+	return Path(image_path).read_text(encoding='utf-8')
+
+
 def set_st_header(
 		main_title: str,
 		image_path: str | Path,
@@ -55,126 +216,37 @@ def set_st_header(
 	# Configure the page to use the wide-screen layout
 	st.set_page_config(layout="wide")
 	
+	# --- Static Style Injection ---
+	# One st.html call carries the sidebar, header and banner stylesheets:
+	# a single frontend message with no markdown parsing involved
+	st.html(_STATIC_CSS)
+
 	# --- Sidebar Configuration ---
-	# Inject custom CSS to center the sidebar title
-	st.markdown(
-		"""
-		<style>
-		[data-testid="stSidebarNav"] + div h1 {
-		   text-align: center;
-		}
-		/* Target the sidebar title specifically */
-		[data-testid="stSidebar"] h1 {
-		   text-align: center;
-		}
-		</style>
-		""",
-		unsafe_allow_html=True
-	)
 	st.sidebar.title(sidebar_title)
 	st.sidebar.divider()
 	
-	# --- Main Page Header Configuration ---
-	# Inject custom CSS for a flexbox-based header (Logo + Text)
-	st.markdown(
-		"""
-		<style>
-		.main-title {
-		   display: flex;
-		   align-items: center; /* Vertical alignment */
-		   justify-content: center; /* Horizontal alignment */
-		   gap: 20px; /* Spacing between logo and text */
-		   margin-bottom: 25px;
-		}
-		.main-title img {
-		   width: 70px; /* Set fixed logo width */
-		   height: auto; /* Maintain aspect ratio */
-		}
-		</style>
-		""",
-		unsafe_allow_html=True
-	)
-	
-	# Convert the logo to base64 for HTML embedding
+	# Convert the logo to a cached data URI for HTML embedding
 	try:
-		image_base64 = get_image_base64(image_path)
-		# Render the logo and title using HTML
-		st.markdown(
-			f"""
+		image_data_uri = get_image_data_uri(image_path)
+		title_key = (main_title, image_data_uri)
+		title_html = _TITLE_HTML_CACHE.get(title_key)
+		if title_html is None:
+			title_html = f"""
             <div class="main-title">
-               <img src="data:image/png;base64,{image_base64}" alt="logo">
+               <img src="{image_data_uri}" alt="logo">
                <h1>{main_title}</h1>
             </div>
-            """,
-			unsafe_allow_html=True
-		)
+            """
+			_TITLE_HTML_CACHE[title_key] = title_html
+		# Render the logo and title using HTML
+		st.markdown(title_html, unsafe_allow_html=True)
 	except Exception:
 		# Fallback if image loading fails
 		st.title(main_title)
 	
 	# --- Notice / Disclaimer Banner with Gradient ---
-	css_style = """
-		<style>
-		@keyframes tech-flow {
-		    0% {
-		        background-position: 0% 50%;
-		        box-shadow: 0 10px 20px -5px rgba(74, 144, 226, 0.5);
-		    }
-		    50% {
-		        background-position: 100% 50%;
-		        box-shadow: 0 15px 30px -5px rgba(144, 19, 254, 0.4);
-		    }
-		    100% {
-		        background-position: 0% 50%;
-		        box-shadow: 0 10px 20px -5px rgba(74, 144, 226, 0.5);
-		    }
-		}
-		@keyframes shimmer {
-		    0% { transform: translateX(-150%) skewX(-25deg); }
-		    100% { transform: translateX(150%) skewX(-25deg); }
-		}
-		.fancy-gradient-box {
-		    background: linear-gradient(-45deg, #4A90E2, #9013FE, #23A6D5, #23D5AB);
-		    background-size: 300% 300%;
-		    animation: tech-flow 8s cubic-bezier(0.4, 0, 0.2, 1) infinite;
-		    color: #FFFFFF;
-		    padding: 10px;
-		    border-radius: 16px;
-		    text-align: center;
-		    font-weight: 600;
-		    font-size: 20px;
-		    margin-bottom: 20px;
-		    line-height: 1.6;
-		    position: relative;
-		    overflow: hidden;
-		    border: 1px solid rgba(255, 255, 255, 0.2);
-		    backdrop-filter: blur(5px);
-		}
-		.fancy-gradient-box::after {
-		    content: "";
-		    position: absolute;
-		    top: 0;
-		    left: 0;
-		    width: 60%;
-		    height: 100%;
-		    background: linear-gradient(
-		        120deg,
-		        transparent,
-		        rgba(255, 255, 255, 0.2),
-		        transparent
-		    );
-		    animation: shimmer 5s infinite linear;
-		    z-index: 1;
-		}
-		</style>
-	"""
-	html_content = f"""
-	<div class="fancy-gradient-box">
-	   Supported by the National Clinical Research Center for Geriatrics & West China Hospital, Sichuan University, China. <br>
-	   <span style="font-size: 18px; opacity: 0.8; font-weight: normal;">For non-commercial use only.</span>
-	</div>
-	"""
-	st.markdown(css_style + html_content, unsafe_allow_html=True)
+	# Styles were already injected above; only the markup is emitted here
+	st.html(_BANNER_HTML)
 
 	# Display mobile-responsive warning
 	show_responsive_warning()
@@ -209,9 +281,12 @@ def show_responsive_warning(
 			warning should be displayed. Defaults to 768 (standard tablet/mobile breakpoint).
 	"""
 	
-	# Define the styling and behavior using an internal CSS block
-	# We use a unique class name to avoid conflicts with Streamlit's native styles
-	st.markdown(f"""
+	# The styling and behavior live in an internal CSS block; the formatted
+	# string is cached per breakpoint so interpolation runs once, not per rerun.
+	# We use a unique class name to avoid conflicts with Streamlit's native styles.
+	alert_html = _MOBILE_ALERT_CACHE.get(breakpoint_px)
+	if alert_html is None:
+		alert_html = f"""
         <style>
         .mobile-only-alert {{
             display: none; /* Default hidden state for desktop/wide screens */
@@ -241,4 +316,7 @@ def show_responsive_warning(
             with detailed prognostic charts and clinical reports, using a desktop
             or tablet browser is highly recommended.
         </div>
-    """, unsafe_allow_html=True)
+    """
+		_MOBILE_ALERT_CACHE[breakpoint_px] = alert_html
+	
+	st.markdown(alert_html, unsafe_allow_html=True)
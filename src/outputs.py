@@ -3,40 +3,117 @@ This project is supported by the Department of Geriatrics and the National Clini
 West China Hospital, Sichuan University, China.
 """
 
-import altair as alt
+import numpy as np
 import pandas as pd
 import streamlit as st
-from src.prediction import load_thresholds, cal_probability_at_time, ensure_survival_func_0_time
+from string import Template
+from src.prediction import load_thresholds, ensure_survival_func_0_time
 
+# Warm the threshold cache at import so the first stratification render
+# does not pay the JSON parse
+load_thresholds("Cox")
 
+
+@st.cache_resource(show_spinner=False)
+def _get_altair():
+	"""Lazily imports Altair, deferring its import cost off the app cold start.
+
+	The chart library is only needed once a prediction is rendered; holding
+	the module reference as a cached resource makes every later lookup a
+	cache hit.
+	"""
+	import altair
+	return altair
+
+# ================= Static HTML Templates =================
+# Pre-compiled once at import so each rerun only performs a cheap
+# Template.substitute instead of re-parsing a large f-string literal.
+
+# Relative-risk progress bar dashboard
+_BAR_TMPL = Template("""
+<div style="margin: 20px 0; font-family: sans-serif; position: relative; width: 100%;">
+    <div style="display: flex; justify-content: space-between; margin-bottom: 12px; font-size: 20px;">
+       <span style="color: #495057;">Relative Risk Scale (RR)</span>
+       <span style="font-weight: bold; color: ${bar_color};">${status_text}</span>
+    </div>
+    <div style="background-color: #e9ecef; border-radius: 12px; height: 24px; width: 100%; border: 1px solid #dee2e6; position: relative; overflow: hidden;">
+       <div style="background-color: ${bar_color}; width: ${progress_width}%; height: 100%; border-radius: 12px; transition: width 0.8s ease-in-out;"></div>
+    </div>
+    <div style="position: relative; height: 30px; margin-top: 10px; font-size: 18px;">
+       <span style="position: absolute; left: 0; color: #000000; transform: translateX(0%);">0.00 (Baseline)</span>
+       <span style="position: absolute; left: ${low_pos}%; color: #28a745; transform: translateX(-50%); white-space: nowrap;">
+          ${low_risk} (Low)
+       </span>
+       <span style="position: absolute; left: ${high_pos}%; color: #dc3545; transform: translateX(-50%); white-space: nowrap;">
+          ${high_risk} (High)
+       </span>
+       <span style="position: absolute; right: 0; color: #990000; transform: translateX(0%); text-align: right;">
+          ${max_bar}+ (Extreme)
+       </span>
+    </div>
+</div>
+""")
+
+# Color-coded assessment summary card
+_SUMMARY_TMPL = Template("""
+<div style="padding:18px; border-radius:10px; border-left: 6px solid ${bar_color}; background-color: #f8f9fa; margin-bottom: 20px;">
+	<strong style="color:${bar_color}; font-size:20px;">Assessment: ${status_text}</strong><br>
+	<span style="color:#6c757d; font-size:20px;">Individual Relative Risk (RR) calculated at <strong>${relative_risk}</strong>.</span>
+</div>
+""")
+
+
+@st.fragment
 def show_risk_metrics(
 		survival_func: pd.Series,
-		eval_times: list[int] | None
+		eval_times: list[int] | tuple[int, ...] | None
 ) -> None:
 	"""Calculates and displays risk metrics for specific time horizons.
 
 	This function categorizes prediction timepoints into Short, Mid, or Long-term
 	prediction and renders them as interactive metric cards in the Streamlit UI.
+	It runs as a fragment, so interactions inside this region rerun only the
+	fragment rather than the whole script.
 
 	Args:
 		survival_func: Individualized survival function.
 		eval_times: Timepoints (in years) to evaluate risk.
 	"""
-	if survival_func.empty or not eval_times:
+	if len(survival_func) == 0 or not eval_times:
 		return
-	
-	# Filter out evaluation times that exceed the model's maximum follow-up duration
-	max_time = survival_func.index.max()
-	valid_times = sorted([t for t in eval_times if t <= max_time])
+
+	# Filter out evaluation times that exceed the model's maximum follow-up
+	# duration; a NumPy mask plus sort stays in C instead of a Python loop.
+	# Survival curves are monotone-indexed by time, so the last index entry
+	# is the maximum — an O(1) read instead of an O(N) scan.
+	max_time = survival_func.index[-1]
+	times_arr = np.fromiter(eval_times, dtype=np.int16, count=len(eval_times))
+	valid_times = np.sort(times_arr[times_arr <= max_time]).tolist()
 	
 	st.markdown("### 📊 Sarcopenia Risk Assessment")
-	
-	# Create dynamic columns based on the number of selected timepoints
-	cols = st.columns(len(valid_times))
-	
-	# Iterate through columns and timepoints to display metric cards
-	for col, t in zip(cols, valid_times):
-		with col:
+
+	# Vectorized lookup: a single forward-fill reindex resolves every
+	# timepoint at once instead of scanning the Series per timepoint
+	surv_vals = survival_func.reindex(valid_times, method="ffill").to_numpy()
+	# Times before the first recorded point default to full survival (S=1.0)
+	risk_vals = 1.0 - np.nan_to_num(surv_vals, nan=1.0)
+
+	# Map each valid horizon to its risk value for O(1) lookup in the loop
+	risk_by_year = dict(zip(valid_times, risk_vals))
+
+	# Fixed 7-column grid: keeping the column count constant lets the React
+	# frontend reuse component identities across reruns instead of diffing a
+	# freshly shaped layout whenever the year selection changes
+	cols = st.columns(7)
+
+	# Iterate through the full follow-up range; unselected years stay empty
+	for idx, t in enumerate(range(1, 8)):
+		with cols[idx]:
+			prob_risk = risk_by_year.get(t)
+			if prob_risk is None:
+				st.empty()
+				continue
+
 			# Categorize the prediction horizon based on the year
 			if t <= 2:
 				horizon_label = "Short-term"
@@ -44,12 +121,9 @@ def show_risk_metrics(
 				horizon_label = "Mid-term"
 			else:
 				horizon_label = "Long-term"
-			
+
 			st.caption(f"⏱️ {horizon_label} Forecast")
-			
-			# Extract risk probability (1 - Survival Probability)
-			# Assuming cal_probability_at_time returns (prob_surv, prob_risk)
-			_, prob_risk = cal_probability_at_time(survival_func, t)
+
 			# Render the metric card
 			st.metric(
 				label=f"{t}-Year Cumulative Risk",
@@ -57,6 +131,7 @@ def show_risk_metrics(
 			)
 
 
+@st.fragment
 def show_risk_stratification(
 		relative_risk: float,
 		status_text: str,
@@ -101,39 +176,28 @@ def show_risk_stratification(
 	# This provides a more intuitive sense of risk location than a simple number.
 	low_pos = (LOW_RISK / MAX_BAR) * 100
 	high_pos = (HIGH_RISK / MAX_BAR) * 100
-	bar_html = f"""
-	<div style="margin: 20px 0; font-family: sans-serif; position: relative; width: 100%;">
-	    <div style="display: flex; justify-content: space-between; margin-bottom: 12px; font-size: 20px;">
-	       <span style="color: #495057;">Relative Risk Scale (RR)</span>
-	       <span style="font-weight: bold; color: {bar_color};">{status_text}</span>
-	    </div>
-	    <div style="background-color: #e9ecef; border-radius: 12px; height: 24px; width: 100%; border: 1px solid #dee2e6; position: relative; overflow: hidden;">
-	       <div style="background-color: {bar_color}; width: {progress_width}%; height: 100%; border-radius: 12px; transition: width 0.8s ease-in-out;"></div>
-	    </div>
-	    <div style="position: relative; height: 30px; margin-top: 10px; font-size: 18px;">
-	       <span style="position: absolute; left: 0; color: #000000; transform: translateX(0%);">0.00 (Baseline)</span>
-	       <span style="position: absolute; left: {low_pos}%; color: #28a745; transform: translateX(-50%); white-space: nowrap;">
-	          {LOW_RISK:.2f} (Low)
-	       </span>
-	       <span style="position: absolute; left: {high_pos}%; color: #dc3545; transform: translateX(-50%); white-space: nowrap;">
-	          {HIGH_RISK:.2f} (High)
-	       </span>
-	       <span style="position: absolute; right: 0; color: #990000; transform: translateX(0%); text-align: right;">
-	          {MAX_BAR:.2f}+ (Extreme)
-	       </span>
-	    </div>
-	</div>
-	"""
+	bar_html = _BAR_TMPL.substitute(
+		bar_color=bar_color,
+		status_text=status_text,
+		progress_width=progress_width,
+		low_pos=low_pos,
+		high_pos=high_pos,
+		low_risk=f"{LOW_RISK:.2f}",
+		high_risk=f"{HIGH_RISK:.2f}",
+		max_bar=f"{MAX_BAR:.2f}",
+	)
 	
 	st.markdown(bar_html, unsafe_allow_html=True)
 	
 	# Summary Card
-	st.markdown(f"""
-	<div style="padding:18px; border-radius:10px; border-left: 6px solid {bar_color}; background-color: #f8f9fa; margin-bottom: 20px;">
-		<strong style="color:{bar_color}; font-size:20px;">Assessment: {status_text}</strong><br>
-		<span style="color:#6c757d; font-size:20px;">Individual Relative Risk (RR) calculated at <strong>{relative_risk:.2f}</strong>.</span>
-	</div>
-	""", unsafe_allow_html=True)
+	st.markdown(
+		_SUMMARY_TMPL.substitute(
+			bar_color=bar_color,
+			status_text=status_text,
+			relative_risk=f"{relative_risk:.2f}",
+		),
+		unsafe_allow_html=True
+	)
 	
 	# 4. Professional Clinical Management Strategies
 	st.markdown("#### 📋 Management Recommendations")
@@ -166,7 +230,7 @@ def show_risk_stratification(
 
 def show_altair_survival_chart(
 		survival_func: pd.Series,
-		highlight_times: list | None = None
+		highlight_times: list | tuple | None = None
 ) -> None:
 	"""Renders a step-function survival curve with shaded area using Altair.
 
@@ -174,18 +238,78 @@ def show_altair_survival_chart(
 	sarcopenia-free trajectory over time. It features interactive tooltips,
 	shaded probability areas, and optional markers for key clinical timepoints.
 
+	Chart construction is delegated to a cached helper keyed on the curve
+	values, so reruns that do not change the prediction skip the Altair
+	spec serialization entirely.
+
 	Args:
 		survival_func: The individualized survival function.
 		highlight_times: Specific timepoints (e.g., [1, 3, 5])
 			to highlight with markers on the curve.
 	"""
-	
+
 	# 1. Data Preparation
-	# Ensure t=0 is included and convert Series to a long-format DataFrame
-	data = ensure_survival_func_0_time(survival_func).reset_index()
-	data.columns = ['Time', 'Survival Probability']
-	
-	# 2. Base Chart Definition
+	# Ensure t=0 is included, then convert the Series to NumPy exactly once.
+	# Probabilities are downcast to FP32 — plenty for a chart — which halves
+	# the numeric payload serialized into the Vega-Lite spec.
+	curve = ensure_survival_func_0_time(survival_func)
+	times = curve.index.to_numpy()
+	probs = curve.to_numpy(dtype=np.float32)
+	max_time = times[-1]
+
+	if highlight_times:
+		# Boolean-mask filter of the requested horizons against the curve range
+		ht_arr = np.fromiter(highlight_times, dtype=np.int16, count=len(highlight_times))
+		valid_highlights = tuple(ht_arr[ht_arr <= max_time].tolist())
+	else:
+		valid_highlights = ()
+
+	# Freeze the arrays into hashable tuples usable as a cache key
+	spec = _build_survival_chart_spec(
+		tuple(times.tolist()),
+		tuple(probs.tolist()),
+		valid_highlights
+	)
+
+	# 2. Chart Display
+	st.markdown("### 📈 Sarcopenia-Free Probability Curve")
+	st.caption(
+		"💡 **Instructions:** Hover over the curve to view precise probabilities. "
+		"Use the mouse wheel to zoom and drag to pan."
+	)
+	st.vega_lite_chart(spec, width='stretch')
+
+
+@st.cache_data(show_spinner=False)
+def _build_survival_chart_spec(
+		times: tuple,
+		probs: tuple,
+		highlight_times: tuple
+) -> dict:
+	"""Builds the layered Altair survival chart and returns its Vega-Lite spec.
+
+	The heavy lifting (layer composition, encoding and spec serialization)
+	only happens when the survival curve or highlight selection actually
+	changes; otherwise the memoized spec dict is reused.
+
+	Args:
+		times: The survival-curve time axis as a hashable tuple.
+		probs: The survival probabilities aligned with `times`.
+		highlight_times: Timepoints to emphasize with markers (may be empty).
+
+	Returns:
+		The chart serialized as a Vega-Lite spec dictionary.
+	"""
+	alt = _get_altair()
+	# Inline records feed the spec directly: no intermediate DataFrame and
+	# no pandas-to-JSON conversion (or max_rows transformer check) on the
+	# serialization path — the values land in the spec dict as-is
+	data = alt.Data(values=[
+		{'Time': t, 'Survival Probability': p}
+		for t, p in zip(times, probs)
+	])
+
+	# Base Chart Definition
 	# Define common encoding and axes for all layers
 	base = alt.Chart(data).encode(
 		x=alt.X(
@@ -204,38 +328,35 @@ def show_altair_survival_chart(
 			alt.Tooltip('Survival Probability:Q', title='Survival Prob.', format='.2%')
 		]
 	)
-	
+
 	# Layer 1: Shaded Area (Step-function interpolation)
 	area = base.mark_area(
 		opacity=0.25,
 		color='#D6EAF8',
 		interpolate='step-after'  # Clinical standard for survival curves
 	)
-	
+
 	# Layer 2: Survival Line
 	line = base.mark_line(
 		color='#2E86C1',
 		strokeWidth=2.5,
 		interpolate='step-after'
 	)
-	
+
 	layers = [area, line]
-	
+
 	# Optional Layer 3: Highlight Key Clinical Timepoints
 	if highlight_times:
-		max_time = data["Time"].max()
-		valid_highlights = [t for t in highlight_times if t <= max_time]
-		
 		points = base.mark_circle(
 			size=150,
 			color='#C0392B',  # Red markers for emphasis
 			opacity=1
 		).transform_filter(
-			alt.FieldOneOfPredicate(field='Time', oneOf=valid_highlights)
+			alt.FieldOneOfPredicate(field='Time', oneOf=list(highlight_times))
 		)
 		layers.append(points)
-	
-	# 3. Chart Configuration & Display
+
+	# Chart Configuration
 	# Combine layers and apply professional styling
 	chart = alt.layer(*layers).properties(
 		# title='Individualized Prognostic Survival Trajectory',
@@ -254,10 +375,5 @@ def show_altair_survival_chart(
 		domainColor='#000000',
 		domainWidth=1.5,
 	).interactive()  # Allows zooming and panning
-	
-	st.markdown("### 📈 Sarcopenia-Free Probability Curve")
-	st.caption(
-		"💡 **Instructions:** Hover over the curve to view precise probabilities. "
-		"Use the mouse wheel to zoom and drag to pan."
-	)
-	st.altair_chart(chart)
+
+	return chart.to_dict()
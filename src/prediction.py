@@ -5,12 +5,47 @@ West China Hospital, Sichuan University, China.
 
 import json
 import joblib
+import functools
 import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
 import pandas as pd
 import streamlit as st
 from typing import Any
 from pathlib import Path
 
+# Resolved once at import: every loader shares these instead of re-running
+# the realpath syscall chain behind Path(__file__).resolve() per call.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_CONFIG_DIR = _PROJECT_ROOT / 'config'
+_MODELS_DIR = _PROJECT_ROOT / 'models'
+
+# Risk categories ordered by the number of thresholds crossed, so the label
+# can be picked by indexing with boolean arithmetic instead of branching.
+_RISK_LABELS = ("Low Risk", "Moderate Risk", "High Risk")
+
+
+@functools.lru_cache(maxsize=8)
+def _build_bounds_arrays(
+		bounds_items: tuple[tuple[str, float, float], ...]
+) -> tuple[tuple[str, ...], np.ndarray, np.ndarray]:
+	"""Builds aligned (names, mins, maxs) arrays from flattened feature bounds.
+
+	The arrays let the plausibility check run as one vectorized comparison
+	instead of a Python-level loop. Results are memoized, so the NumPy
+	allocation happens once per distinct bounds configuration.
+
+	Args:
+		bounds_items: Flattened (feature, min, max) triples in a fixed order.
+
+	Returns:
+		A tuple of the feature-name tuple and two float64 arrays holding the
+		per-feature lower and upper training bounds.
+	"""
+	names = tuple(item[0] for item in bounds_items)
+	mins = np.array([item[1] for item in bounds_items], dtype=np.float64)
+	maxs = np.array([item[2] for item in bounds_items], dtype=np.float64)
+	return names, mins, maxs
+
 
 def check_data_plausibility(
 		personal_data: dict,
@@ -35,18 +70,26 @@ def check_data_plausibility(
 		training bounds, e.g., ["Age (115)", "BMI (14.2)"]. Returns an
 		empty list if all inputs are within the valid range.
 	"""
-	warnings = []
-	
-	for feature, val in personal_data.items():
-		# Retrieve the valid range for the current feature
-		val_range = feature_bounds.get(feature)
-		
-		if val_range is not None and val is not None:
-			# Check if the clinical metric is an outlier relative to training data
-			if val < val_range['min'] or val > val_range['max']:
-				warnings.append(f"{feature} ({val})")
-	
-	return warnings
+	# Flatten the bounds into a hashable key; the aligned NumPy arrays are
+	# built (and cached) from it so the comparisons below run in C.
+	bounds_items = tuple(
+		(feature, val_range['min'], val_range['max'])
+		for feature, val_range in feature_bounds.items()
+	)
+	names, mins, maxs = _build_bounds_arrays(bounds_items)
+
+	# Missing inputs map to NaN: NaN comparisons are False, so absent
+	# features are skipped naturally without any per-feature branching.
+	vals = np.fromiter(
+		(np.nan if raw is None else raw for raw in (personal_data.get(f) for f in names)),
+		dtype=np.float64,
+		count=len(names),
+	)
+
+	# Single vectorized outlier test against the training distribution
+	mask = (vals < mins) | (vals > maxs)
+
+	return [f"{names[i]} ({personal_data[names[i]]})" for i in np.flatnonzero(mask)]
 
 
 @st.cache_resource
@@ -64,17 +107,15 @@ def load_model_assets(
 			specific model assets. Defaults to "Cox".
 
 	Returns:
-		A dictionary containing three keys:
+		A dictionary containing four keys:
 			- "features": List of feature names required by the model.
 			- "preprocessors": List of fitted ColumnTransformer objects.
 			- "models": List of trained survival analysis models (e.g., CoxPHFitter).
+			- "fast": Stacked Cox parameters for the batched NumPy prediction
+			  path, or None when the models cannot be represented that way.
 	"""
-	# Obtain the absolute path of the current script
-	current_file = Path(__file__).resolve()
-	
-	# Locate the project root directory (assuming this script is inside 'src/')
-	project_root = current_file.parent.parent
-	base_path = project_root / 'models' / method_name
+	# Locate the model directory under the precomputed project root
+	base_path = _MODELS_DIR / method_name
 	
 	# Safety check: Verify if the model directory exists to prevent FileNotFoundError
 	if not base_path.exists():
@@ -82,18 +123,51 @@ def load_model_assets(
 		st.stop()
 	
 	# Load feature names from the text file (tab-separated)
-	with open(base_path / 'final_model_features.txt', 'r', encoding='utf-8') as f:
-		features = f.read().strip().split('\t')
+	features = (base_path / 'final_model_features.txt').read_text(encoding='utf-8').strip().split('\t')
 	
-	# Load serialized assets using joblib
+	# Load serialized assets using joblib. mmap_mode='r' maps the embedded
+	# NumPy buffers read-only instead of copying them onto the heap, so
+	# concurrent server processes share the pages through the OS cache.
+	preprocessors = joblib.load(base_path / 'final_feature_preprocessors.joblib', mmap_mode='r')
+	models = joblib.load(base_path / 'final_models.joblib', mmap_mode='r')
+
 	assets = {
 		"features": features,
-		"preprocessors": joblib.load(base_path / 'final_feature_preprocessors.joblib'),
-		"models": joblib.load(base_path / 'final_models.joblib')
+		# The same schema as a prebuilt pandas Index: DataFrame construction
+		# during inference reuses it instead of converting the list per call
+		"features_index": pd.Index(features),
+		"preprocessors": preprocessors,
+		"models": models,
+		# Extracted once here, under the resource cache, so every prediction
+		# starts from ready-to-use stacked Cox parameters
+		"fast": _extract_fast_bundle(models, features),
 	}
 	return assets
 
 
+@st.cache_resource(show_spinner=False)
+def _load_feature_bounds() -> dict:
+	"""Loads the training-cohort feature bounds used for the OOD check.
+
+	The bounds are deployment constants, so they are cached as a resource:
+	the JSON file is opened and parsed once per process instead of on every
+	prediction call. Callers must treat the returned mapping as read-only.
+
+	Returns:
+		The parsed feature-bounds mapping ({feature: {'min': ..., 'max': ...}}),
+		or an empty dict when the configuration file is absent.
+	"""
+	config_path = _CONFIG_DIR / 'feature_bounds.json'
+
+	try:
+		with open(config_path, 'r', encoding='utf-8') as f:
+			return json.load(f)
+	except FileNotFoundError:
+		# Missing configuration disables the OOD warning but not prediction
+		return {}
+
+
+@st.cache_resource(show_spinner=False)
 def load_thresholds(
 		method_name: str = "Cox"
 ) -> dict[str, float]:
@@ -104,6 +178,10 @@ def load_thresholds(
 	stratification logic remains decoupled from the core UI code for easier
 	maintenance and updates.
 
+	The thresholds are deployment constants, so they are held as a cached
+	resource: loaded once per process and shared by reference. Callers must
+	treat the returned dictionary as read-only.
+
 	Args:
 		method_name: The name of the specific model or algorithm whose
 			thresholds are being requested. Defaults to "Cox".
@@ -114,8 +192,8 @@ def load_thresholds(
 			- "high_risk": The lower bound for the high-risk category.
 			- "max_display_rr": The maximum value for the visual progress bar.
 	"""
-	# Resolve the path to the config directory relative to this script
-	config_path = Path(__file__).resolve().parent.parent / 'config' / 'thresholds.json'
+	# Resolve the path against the precomputed config directory
+	config_path = _CONFIG_DIR / 'thresholds.json'
 	
 	try:
 		with open(config_path, 'r', encoding='utf-8') as f:
@@ -126,16 +204,161 @@ def load_thresholds(
 		return {}
 
 
+@st.cache_resource(show_spinner=False)
+def _get_fold_executor(
+		max_workers: int
+) -> ThreadPoolExecutor:
+	"""Returns a process-wide thread pool for fanning out fold inference.
+
+	Caching the pool as a resource avoids re-spawning worker threads on every
+	prediction call; lifelines/sklearn spend their time in NumPy/BLAS code
+	that releases the GIL, so the folds genuinely run in parallel.
+
+	Args:
+		max_workers: The number of worker threads (one per ensemble fold).
+
+	Returns:
+		A shared ThreadPoolExecutor instance.
+	"""
+	return ThreadPoolExecutor(max_workers=max_workers)
+
+
+# Per-preprocessor column permutation mapping transformed output onto the
+# model's feature order, keyed by the preprocessor object itself (sklearn
+# estimators hash by identity). Holding the object as the key pins it, so a
+# preprocessor freed by a resource-cache clear can never alias a new one
+# through CPython id reuse. Computing the permutation once turns the
+# per-fold schema re-alignment into a single NumPy column slice; None
+# records that the output is already in model order and needs no slice.
+_PERM_CACHE: dict[Any, np.ndarray | None] = {}
+
+
+def _get_feature_permutation(
+		preprocessor: Any,
+		features: list[str]
+) -> np.ndarray | None:
+	"""Returns the column permutation aligning a preprocessor's output to `features`.
+
+	The fitted preprocessor emits columns in its own deterministic order, so
+	the ordering is verified once per preprocessor and cached. The common
+	case — output already in model order — is recorded as None so callers
+	can skip the fancy-index copy entirely.
+
+	Args:
+		preprocessor: The fold's fitted ColumnTransformer.
+		features: The deterministic order of predictors expected by the model.
+
+	Returns:
+		An integer index array such that `output[:, perm]` is in model
+		order, or None when the output is already ordered.
+	"""
+	if preprocessor not in _PERM_CACHE:
+		cols = list(preprocessor.get_feature_names_out())
+		if cols == list(features):
+			# Zero-copy fast path: columns already match the model schema
+			_PERM_CACHE[preprocessor] = None
+		else:
+			try:
+				_PERM_CACHE[preprocessor] = np.array([cols.index(f) for f in features], dtype=np.intp)
+			except ValueError as e:
+				st.error(f"❌ Schema Mismatch: Preprocessor output does not match required features. {e}")
+				st.stop()
+	return _PERM_CACHE[preprocessor]
+
+
+def _extract_fast_bundle(
+		models: list,
+		features: list[str]
+) -> tuple | None:
+	"""Extracts stacked Cox parameters enabling batched NumPy inference.
+
+	For a fitted CoxPHFitter, the partial hazard is exp((x - mean) . beta)
+	and the survival curve is baseline_survival ** partial_hazard. Pulling
+	beta, the normalization means and the baseline curves out of the K fold
+	models lets all folds be evaluated with a handful of array operations
+	instead of K lifelines predict_* round-trips.
+
+	Args:
+		models: The fold survival estimators.
+		features: The deterministic order of predictors.
+
+	Returns:
+		A (betas, norm_means, baseline_times, baseline_survs) tuple of
+		stacked arrays, or None when the models do not expose the expected
+		Cox internals or their baseline time grids differ.
+	"""
+	try:
+		betas = np.stack([m.params_.reindex(features).to_numpy() for m in models])
+		norm_means = np.stack([m._norm_mean.reindex(features).to_numpy() for m in models])
+
+		# All folds must share one baseline grid for a rectangular stack
+		ref_index = models[0].baseline_survival_.index
+		if any(not m.baseline_survival_.index.equals(ref_index) for m in models[1:]):
+			return None
+		baseline_survs = np.stack([
+			m.baseline_survival_.iloc[:, 0].to_numpy() for m in models
+		])
+	except AttributeError:
+		return None
+
+	# A NaN from reindexing means a coefficient name did not line up
+	if np.isnan(betas).any() or np.isnan(norm_means).any():
+		return None
+
+	return betas, norm_means, ref_index.to_numpy(), baseline_survs
+
+
+def _predict_one_fold(
+		model: Any,
+		preprocessor: Any,
+		person_data_df: pd.DataFrame,
+		features: pd.Index
+) -> tuple[pd.DataFrame, np.ndarray]:
+	"""Runs the full inference pipeline for a single ensemble fold.
+
+	Args:
+		model: The fold's trained survival estimator (e.g., CoxPHFitter).
+		preprocessor: The fold's fitted ColumnTransformer.
+		person_data_df: The (N, D) input DataFrame in model feature order.
+		features: The deterministic order of predictors as a pandas Index,
+			reused directly as the column labels of the model input frame.
+
+	Returns:
+		A tuple of the fold's predicted survival functions (time x patient
+		DataFrame) and its partial hazards as a length-N array.
+	"""
+	# A. Feature Transformation: Scaling and categorical encoding
+	X_processed_values = preprocessor.transform(person_data_df)
+
+	# B/C. Schema Re-alignment: a cached integer permutation replaces the
+	# intermediate labeled DataFrame and its per-fold column lookup; when
+	# the output is already ordered (perm is None) the array is used as-is
+	perm = _get_feature_permutation(preprocessor, features)
+	if perm is not None:
+		X_processed_values = X_processed_values[:, perm]
+	X_final = pd.DataFrame(X_processed_values, columns=features)
+
+	# D/E. Survival functions and exponentiated risk scores (RR) for this fold
+	survival_func = model.predict_survival_function(X_final)
+	risk_scores = model.predict_partial_hazard(X_final).to_numpy()
+	return survival_func, risk_scores
+
+
 def cal_single_person_surv_func(
-		personal_data_dict: dict,
+		personal_data_dict: dict | list[dict],
 		assets: dict
-) -> tuple[pd.Series, float, str]:
+) -> tuple[pd.Series, float, str] | tuple[list[pd.Series], list[float], list[str]]:
 	"""Calculates individualized survival probability and clinical risk stratification.
 
 	This function executes a multi-stage ensemble prediction pipeline designed for
 	robustness in clinical settings. It integrates multiple cross-validated Cox-based
 	models to mitigate bias and provide a consensus survival estimate.
 
+	Passing a list of patient dictionaries evaluates the whole batch through
+	the same preprocessor/model calls — one (N, D) matrix per fold instead of
+	N separate pipeline runs — which keeps cohort-style workflows (what-if
+	sweeps, threshold recalibration) out of Python-level loops.
+
 	The pipeline involves:
 	1.  **Plausibility Verification**: Validates if input characteristics are within the
 		distribution of the training cohort to ensure predictive reliability.
@@ -149,11 +372,13 @@ def cal_single_person_surv_func(
 
 	Args:
 		personal_data_dict: A collection of patient baseline characteristics
-			(e.g., age, BMI, circumferences) obtained from clinical assessment.
+			(e.g., age, BMI, circumferences) obtained from clinical assessment,
+			or a list of such collections for batch evaluation.
 		assets: A structured container of trained model components including:
 			- "features" (list): The deterministic order of predictors.
 			- "preprocessors" (list): Fitted ColumnTransformers for normalization.
 			- "models" (list): Trained survival estimators (e.g., CoxPHFitter).
+			- "fast" (tuple | None): Stacked Cox parameters for batched inference.
 
 	Returns:
 		A tri-element tuple containing:
@@ -162,85 +387,229 @@ def cal_single_person_surv_func(
 			- relative_risk (float): The consensus Partial Hazard (exp(βx)), representing
 			  the individual's risk multiplier relative to the population mean.
 			- status_text (str): Qualitative clinical risk category ("Low", "Moderate", or "High Risk").
+			For list input, each element is the corresponding list of per-patient results.
 	"""
-	
-	# ================= 0. Data Plausibility Check (Out-of-Distribution Detection) =================
-	try:
-		# Define path to the pre-calculated training data distribution boundaries
-		config_path = Path(__file__).resolve().parent.parent / 'config' / 'feature_bounds.json'
-		
-		with open(config_path, 'r', encoding='utf-8') as f:
-			feature_bounds = json.load(f)
-			# Identify metrics exceeding the model's validated range to warn users of uncertainty
-			out_of_bounds_features = check_data_plausibility(personal_data_dict, feature_bounds)
-			if out_of_bounds_features:
-				st.warning(
-					f"⚠️ **Caution:** The following inputs are outside the model's core validation range: "
-					f"{', '.join(out_of_bounds_features)}. "
-					"The prediction results may have increased uncertainty."
-				)
-	except FileNotFoundError:
-		# Fallback if configuration is missing; proceed with prediction but without OOD warning
-		pass
+
+	# ================= 0. Input Normalization & Plausibility Check =================
+	# Single-patient input is treated as a batch of one so the pipeline below
+	# only ever deals with (N, D) shapes
+	is_batch = isinstance(personal_data_dict, list)
+	records: list[dict] = personal_data_dict if is_batch else [personal_data_dict]
+
+	# The training-distribution boundaries are parsed once per process; an
+	# empty mapping (missing config) yields no warnings and skips the check.
+	feature_bounds = _load_feature_bounds()
+	if feature_bounds:
+		# Identify metrics exceeding the model's validated range to warn users of uncertainty
+		out_of_bounds_features = [
+			warning if not is_batch else f"patient {n}: {warning}"
+			for n, record in enumerate(records)
+			for warning in check_data_plausibility(record, feature_bounds)
+		]
+		if out_of_bounds_features:
+			st.warning(
+				f"⚠️ **Caution:** The following inputs are outside the model's core validation range: "
+				f"{', '.join(out_of_bounds_features)}. "
+				"The prediction results may have increased uncertainty."
+			)
 	
 	# ================= 1. Resource Initialization =================
 	# Extract structural assets required for the ensemble pipeline
 	features = assets["features"]
 	preprocessors = assets["preprocessors"]
 	models = assets["models"]
-	
+	# Prebuilt column Index from load_model_assets; rebuilt here only for
+	# callers assembling their own assets dict
+	features_index = assets.get("features_index")
+	if features_index is None:
+		features_index = pd.Index(features)
+
 	# ================= 2. Data Preprocessing =================
-	# Construct a single-row DataFrame ensured to match the model's feature schema
-	person_data_df = pd.DataFrame([personal_data_dict])[features]
-	
-	all_survival_funcs: list[pd.DataFrame] = []
-	risk_scores: list[float] = []
-	
-	# ================= 3. Iterative Prediction (Ensemble) =================
-	# Iterate through cross-validation folds to derive a robust consensus estimate
-	for model, preprocessor in zip(models, preprocessors):
-		
-		# A. Feature Transformation: Scaling and categorical encoding
-		X_processed_values = preprocessor.transform(person_data_df)
-		
-		# B. Schema Reconstruction: Mapping NumPy arrays back to labeled DataFrames
-		cols = preprocessor.get_feature_names_out()
-		X_processed = pd.DataFrame(X_processed_values, columns=cols)
-		
-		# C. Feature Re-alignment: Ensuring exact column ordering for position-dependent models
-		try:
-			X_final = X_processed[features]
-		except KeyError as e:
-			st.error(f"❌ Schema Mismatch: Preprocessor output does not match required features. {e}")
-			st.stop()
-		
-		# D. Survival Function Prediction: Estimating individualized survival curves
-		all_survival_funcs.append(model.predict_survival_function(X_final))
-		
-		# E. Partial Hazard Calculation: Obtaining the exponentiated risk score (RR)
-		risk_scores.append(model.predict_partial_hazard(X_final).item())
-	
-	# ================= 4. Result Ensemble & Aggregation =================
-	# Perform arithmetic averaging across all folds to stabilize predictive variance
-	avg_survival_func: pd.Series = pd.concat(all_survival_funcs, axis=1).mean(axis=1)
-	
-	# Aggregate relative risk scores into a single clinical metric
-	relative_risk = float(np.mean(risk_scores))
-	
+	# Construct the (N, D) input as a float64 ndarray in model feature order,
+	# so the numeric conversion happens in C, then wrap it without copying.
+	# The DataFrame wrapper stays because the fold preprocessors were fitted
+	# on named columns and validate feature names on transform; the prebuilt
+	# Index saves pandas the list-to-Index conversion on every call.
+	values = np.array(
+		[[record[f] for f in features] for record in records],
+		dtype=np.float64
+	)
+	person_data_df = pd.DataFrame(values, columns=features_index, copy=False)
+
+	# ================= 3. Ensemble Prediction =================
+	# Fast path: with the Cox internals stacked into matrices, all K folds
+	# and N patients reduce to one exp((X - means) . betas) for the partial
+	# hazards and one broadcast power for the survival curves — no lifelines
+	# round-trips. The bundle is prepared once at asset-load time.
+	bundle = assets.get("fast")
+
+	if bundle is not None:
+		betas, norm_means, baseline_times, baseline_survs = bundle
+
+		# Stack each fold's preprocessed rows into a single (K, N, D) tensor,
+		# permuting columns only when a fold's output is not already ordered.
+		# Folds sharing one preprocessor object reuse its transformed matrix
+		# instead of re-running the identical transform.
+		fold_rows = []
+		transformed_by_id: dict[int, np.ndarray] = {}
+		for preprocessor in preprocessors:
+			X_fold = transformed_by_id.get(id(preprocessor))
+			if X_fold is None:
+				X_fold = preprocessor.transform(person_data_df)
+				perm = _get_feature_permutation(preprocessor, features)
+				if perm is not None:
+					X_fold = X_fold[:, perm]
+				transformed_by_id[id(preprocessor)] = X_fold
+			fold_rows.append(X_fold)
+		X = np.stack(fold_rows)
+
+		# All folds and patients at once: (K, N) hazards, (K, N, T) curves
+		fold_risks = np.exp(((X - norm_means[:, None, :]) * betas[:, None, :]).sum(axis=2))
+		surv_tensor = baseline_survs[:, None, :] ** fold_risks[:, :, None]
+
+		relative_risks = fold_risks.mean(axis=0)
+		mean_curves = surv_tensor.mean(axis=0)
+		survival_funcs = [
+			pd.Series(mean_curves[n], index=baseline_times)
+			for n in range(len(records))
+		]
+	else:
+		# Fallback: fan the folds out over the shared thread pool and go
+		# through the estimators' own predict_* methods
+		executor = _get_fold_executor(len(models))
+		fold_results = list(executor.map(
+			_predict_one_fold,
+			models,
+			preprocessors,
+			[person_data_df] * len(models),
+			[features_index] * len(models),
+		))
+		all_survival_funcs = [sf for sf, _ in fold_results]
+		risk_matrix = np.stack([rr for _, rr in fold_results])
+
+		# ================= 4. Result Ensemble & Aggregation =================
+		# Cox folds share one baseline time grid, so the curves stack into a
+		# (fold x time x patient) tensor and average in a single C pass; the
+		# pandas alignment path remains should the grids diverge.
+		ref_index = all_survival_funcs[0].index
+		if all(sf.index.equals(ref_index) for sf in all_survival_funcs[1:]):
+			surv_tensor = np.stack([sf.to_numpy() for sf in all_survival_funcs])
+			mean_curves = surv_tensor.mean(axis=0)
+			survival_funcs = [
+				pd.Series(mean_curves[:, n], index=ref_index)
+				for n in range(len(records))
+			]
+		else:
+			survival_funcs = [
+				pd.concat([sf.iloc[:, n] for sf in all_survival_funcs], axis=1).mean(axis=1)
+				for n in range(len(records))
+			]
+
+		# Aggregate relative risk scores into per-patient clinical metrics
+		relative_risks = risk_matrix.mean(axis=0)
+
 	# ================= 5. Clinical Risk Stratification =================
-	# Categorize the patient based on pre-defined clinical hazard thresholds
+	# Categorize the patients based on pre-defined clinical hazard thresholds;
+	# load_thresholds is a cached resource, so this is a dict lookup, and the
+	# label index counts how many thresholds each consensus RR has crossed
 	thresholds = load_thresholds()
 	LOW_RISK_VAL = thresholds.get("low_risk", 0.6)
 	HIGH_RISK_VAL = thresholds.get("high_risk", 1.6)
-	
-	if relative_risk < LOW_RISK_VAL:
-		status_text = "Low Risk"
-	elif relative_risk > HIGH_RISK_VAL:
-		status_text = "High Risk"
-	else:
-		status_text = "Moderate Risk"
-	
-	return avg_survival_func, relative_risk, status_text
+
+	label_indices = (relative_risks >= LOW_RISK_VAL).astype(np.intp) + (relative_risks > HIGH_RISK_VAL)
+	status_texts = [_RISK_LABELS[i] for i in label_indices]
+
+	# Single-patient callers keep the original scalar return shape
+	if not is_batch:
+		return survival_funcs[0], float(relative_risks[0]), status_texts[0]
+
+	return survival_funcs, [float(rr) for rr in relative_risks], status_texts
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_single_prediction(
+		personal_data_items: tuple,
+		method_name: str
+) -> tuple[pd.Series, float, str]:
+	"""Runs a single-patient prediction memoized on the frozen input items.
+
+	Streamlit replays the st.warning elements emitted inside on cache hits,
+	so out-of-distribution notices still appear for repeated submissions.
+
+	Args:
+		personal_data_items: The patient dict frozen to sorted (key, value)
+			pairs, with list values converted to tuples.
+		method_name: The model directory name passed to load_model_assets.
+
+	Returns:
+		The cal_single_person_surv_func result tuple for this patient.
+	"""
+	assets = load_model_assets(method_name)
+	return cal_single_person_surv_func(dict(personal_data_items), assets)
+
+
+def cal_single_person_surv_func_cached(
+		personal_data_dict: dict,
+		method_name: str = "Cox"
+) -> tuple[pd.Series, float, str]:
+	"""Memoized front end for single-patient prediction.
+
+	Re-submitting an unchanged form is common (accidental double clicks,
+	toggling a value back); freezing the input dict into a hashable key lets
+	st.cache_data return the previous result without re-entering the
+	ensemble pipeline at all.
+
+	Args:
+		personal_data_dict: Patient baseline characteristics.
+		method_name: The model directory name. Defaults to "Cox".
+
+	Returns:
+		The same (survival_func, relative_risk, status_text) tuple as
+		cal_single_person_surv_func.
+	"""
+	frozen_items = tuple(sorted(
+		(key, tuple(val) if isinstance(val, list) else val)
+		for key, val in personal_data_dict.items()
+	))
+	return _cached_single_prediction(frozen_items, method_name)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_prediction_executor() -> ThreadPoolExecutor:
+	"""Returns the process-wide single-worker pool for background predictions.
+
+	One worker serializes submitted predictions, so a burst of submissions
+	cannot oversubscribe the fold thread pool underneath.
+
+	Returns:
+		A shared single-worker ThreadPoolExecutor.
+	"""
+	return ThreadPoolExecutor(max_workers=1)
+
+
+def submit_surv_func_prediction(
+		personal_data_dict: dict | list[dict],
+		assets: dict
+) -> Future:
+	"""Schedules a prediction on a background worker and returns its Future.
+
+	This decouples the ensemble inference from the script thread: a caller
+	can stash the Future in st.session_state, keep rendering the last valid
+	result, and pick up the new one once .done() is True. The synchronous
+	path (calling cal_single_person_surv_func directly) remains available
+	and is what the main form-driven page uses.
+
+	Args:
+		personal_data_dict: Patient characteristics, or a list of them for
+			batch evaluation.
+		assets: The cached model asset container from load_model_assets.
+
+	Returns:
+		A Future resolving to the cal_single_person_surv_func result tuple.
+	"""
+	return _get_prediction_executor().submit(
+		cal_single_person_surv_func, personal_data_dict, assets
+	)
 
 
 def cal_probability_at_time(
@@ -267,15 +636,17 @@ def cal_probability_at_time(
 			- prob_surv: Survival probability at the given time.
 			- prob_disease: Probability of disease occurrence (1 - survival).
 	"""
-	
+
 	# Obtain survival probability; disease probability is defined as 1 - S(t).
-	# .asof(time) retrieves the last available value at or before the specified time.
-	# If the requested time is before the first recorded data point (e.g., Day 0),
-	# the survival probability defaults to 1.0 (100%).
-	prob_surv = survival_func.asof(time)
-	if pd.isna(prob_surv):
-		prob_surv = 1.0
-	
+	# The look-back semantics of Series.asof (last available value at or
+	# before `time`) are reproduced with a branchless binary search over the
+	# underlying arrays, skipping pandas' per-call Index machinery. Requests
+	# before the first recorded data point default to 1.0 (100% survival).
+	times = survival_func.index.to_numpy()
+	probs = survival_func.to_numpy()
+	pos = np.searchsorted(times, time, side='right') - 1
+	prob_surv = 1.0 if pos < 0 else float(probs[pos])
+
 	return prob_surv, 1 - prob_surv
 
 
@@ -295,13 +666,19 @@ def ensure_survival_func_0_time(
 	Returns:
 		The survival function with the baseline origin ensured.
 	"""
-	
-	# Check if the baseline time point (0.0) exists in the index.
-	if 0 not in survival_func.index:
-		# Prepend a survival probability of 1.0 at t=0 and re-sort the index.
-		survival_func = pd.concat([
-			pd.Series([1.0], index=[0.0]),
-			survival_func
-		]).sort_index()
-	
-	return survival_func
+
+	# Fast path: curves arrive sorted by time, so a positional check on the
+	# first label replaces a hash lookup over the whole float index.
+	if len(survival_func) > 0 and survival_func.index[0] == 0:
+		return survival_func
+
+	# Prepend (t=0, p=1.0) with one O(N) copy into preallocated arrays; the
+	# sorted-input invariant makes the old concat + sort_index unnecessary.
+	new_times = np.empty(len(survival_func) + 1)
+	new_probs = np.empty_like(new_times)
+	new_times[0] = 0.0
+	new_probs[0] = 1.0
+	new_times[1:] = survival_func.index.to_numpy()
+	new_probs[1:] = survival_func.to_numpy()
+
+	return pd.Series(new_probs, index=new_times)
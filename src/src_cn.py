@@ -464,13 +464,17 @@ def show_key_metrics(survival_func, eval_times):
 	
 	# 动态生成列：数量 = 列表长度
 	cols = st.columns(len(eval_times))
-	
+
+	# 一次二分查找批量求出所有时间点的生存概率（与逐点 asof 语义一致，
+	# 早于首个时间点的查询默认生存率 1.0），循环内只负责渲染
+	pos = np.searchsorted(survival_func.index.to_numpy(), eval_times, side='right') - 1
+	surv_probs = np.where(pos < 0, 1.0, survival_func.to_numpy()[np.maximum(pos, 0)])
+
 	# 遍历列和元素，一一对应输出
-	for col, t in zip(cols, eval_times):
+	for col, t, surv_prob in zip(cols, eval_times, surv_probs):
 		with col:
-			_, prob_risk = cal_probability_at_time(survival_func, t)
-			# 显示指标结果
-			st.metric(label=f"{t}年内患病风险", value=f"{prob_risk:.2%}", delta="长期预测", delta_color="inverse")
+			# 显示指标结果：患病概率就是 1 - 生存概率
+			st.metric(label=f"{t}年内患病风险", value=f"{1 - surv_prob:.2%}", delta="长期预测", delta_color="inverse")
 	
 	# 添加更详细的背书说明 (Badge)
 	st.caption(f"""
@@ -478,94 +482,3 @@ def show_key_metrics(survival_func, eval_times):
 	在外部验证集中，模型的区分度 (C-index) 达到 ****，
 	校准度 (Brier Score) 表现优异，具有较高的临床参考价值。
 	""")
-
-
-def show_altair_survival_chart(survival_func, highlight_times=None):
-	"""
-	使用 Altair 在streamlit网页中画出带阴影的阶梯状生存曲线。
-
-	Args:
-		survival_func (pd.Series): 用户的生存函数。
-		highlight_times (list | None): 需要特别标注的时间点，如 [1, 3, 5, 7]
-	"""
-	
-	# 1. 数据准备
-	# .reset_index()将生存函数的index放进列当中，变成DataFrame，
-	# 原来的 Index 变成了名为 index 的一列，原来的 Values 变成了名为 0 的一列。
-	# 后面设定列名后方便alt读取数据画图
-	data = ensure_survival_func_0_time(survival_func).reset_index()
-	data.columns = ['Time', 'Survival Probability']
-	
-	# 2. 定义图表
-	# 创建一个基础层
-	base = alt.Chart(data).encode(
-		x=alt.X(shorthand='Time',  # 数据列的名称
-		        title='Time (Years)',
-		        # 强制刻度最小间隔为1，且格式化为整数
-		        axis=alt.Axis(tickMinStep=1, format='d', grid=False)
-		        ),
-		y=alt.Y(shorthand='Survival Probability',
-		        title='Survival Probability (No Sarcopenia)',
-		        # Y轴范围固定，格式化为百分比(或.2f)
-		        scale=alt.Scale(domain=[0, 1.05]),
-		        axis=alt.Axis(format='.2f')
-		        ),
-		tooltip=[
-			# 悬停时显示的第一行：标题是"Time"，数值取自'Time'列，格式为整数('d')
-			alt.Tooltip(shorthand='Time', title='Time:', format='d'),
-			# 悬停时显示的第二行：标题是"Survival Probability"，数值取自'Survival Probability'列，格式为百分比('.2%')
-			alt.Tooltip(shorthand='Survival Probability', title='Survival Probability:', format='.2%')
-		]
-	)
-	
-	# 层1: 区域填充 (带阶梯)
-	area = base.mark_area(
-		opacity=0.4,
-		color='#2E86C1',
-		interpolate='step-after'  # 【关键】设置阶梯状填充
-	)
-	
-	# 层2: 线条 (带阶梯)
-	line = base.mark_line(
-		color='#2E86C1',
-		interpolate='step-after'  # 【关键】设置阶梯状线条
-	)
-	
-	# 基础图层
-	layers = [area, line]
-	
-	# 可选层3: 标出关键数据点
-	if highlight_times is not None:
-		# 去除掉实际生存函数中不存在的时间点
-		max_time = data["Time"].max()
-		highlight_times = [t for t in highlight_times if t <= max_time]
-		
-		# 使用过滤器保留关键点
-		points = base.mark_circle(
-			size=100,
-			color='red',
-			opacity=1  # 只要通过了过滤器的点，全部显示
-		).transform_filter(
-			# 使用 FieldOneOfPredicate 过滤数据，保留 Time 在指定列表中的数据行
-			alt.FieldOneOfPredicate(field='Time', oneOf=highlight_times)
-		)
-		# 添加该层
-		layers.append(points)
-	
-	# 组合图层
-	chart = alt.layer(*layers).properties(
-		title='个体化生存预测曲线 (Altair)',
-		height=450
-	).configure_axis(
-		labelFontSize=12,
-		titleFontSize=14,
-		# labelFont='Times New Roman', # 坐标轴标签字体
-		# titleFont='Times New Roman', # 坐标轴标题字体(推荐用中文避免乱码)
-		grid=True,  # 开启网格
-		gridDash=[2, 2],  # 虚线网格
-		gridOpacity=0.3
-	).interactive()  # 开启交互 (缩放平移)
-	
-	st.markdown("### 📈 动态生存轨迹")
-	st.caption("💡 提示：将鼠标悬停在曲线上可查看精确数值，支持滚轮缩放和拖拽平移。")
-	st.altair_chart(chart)
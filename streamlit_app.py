@@ -5,8 +5,8 @@ West China Hospital, Sichuan University, China.
 
 import datetime
 import streamlit as st
-from src.layouts import set_st_header
-from src.prediction import load_model_assets, cal_single_person_surv_func
+from src.layouts import set_st_header, get_svg_markup
+from src.prediction import cal_single_person_surv_func_cached
 from src.inputs import get_user_input_sidebar
 from src.outputs import show_risk_metrics, show_risk_stratification, show_altair_survival_chart
 from src.report_generator import plot_survival_curve, generate_report_pdf
@@ -39,63 +39,60 @@ def run_st_app() -> None:
             each variable to the final prediction. Factors on the right increase
             risk (HR > 1), while those on the left are protective (HR < 1).
         """)
-		# Display the static SVG forest plot from the model directory
-		st.image("models/Cox/forest_plot.svg", width='stretch')
+		# Display the static SVG forest plot from the model directory; the
+		# markup is read once and served from cache on every rerun
+		st.image(get_svg_markup("models/Cox/forest_plot.svg"), width='stretch')
 	
 	# --- 3. Session State Initialization ---
 	# Prevents unnecessary re-computation during Streamlit reruns
 	if "inference_results" not in st.session_state:
-		# Stores: survival_func, avg_rr, risk_status, and pdf_bytes
+		# Stores: survival_func, avg_rr, and risk_status
 		st.session_state.inference_results = None
-	
+
 	if "frozen_params" not in st.session_state:
 		# Stores a snapshot of the parameters used for the current cached result
 		st.session_state.frozen_params = None
+
+	if "report_pdf" not in st.session_state:
+		# Stores the lazily composed PDF report for the current prediction
+		st.session_state.report_pdf = None
 	
 	# --- 4. Sidebar Input Handling ---
-	# Real-time retrieval of user inputs from the sidebar
-	current_input_data, is_form_complete = get_user_input_sidebar()
-	
+	# Inputs are batched inside a form: one rerun per submission instead of
+	# one rerun per widget interaction
+	current_input_data, is_form_complete, submitted = get_user_input_sidebar()
+
 	# --- 5. Assessment Execution Logic ---
-	if st.sidebar.button("🩺 Run Assessment", type="primary"):
+	if submitted:
 		if not is_form_complete:
 			st.error("❌ Incomplete Data: Please fill in all clinical parameters before proceeding.")
 			st.stop()
 		else:
 			with st.spinner("Executing consensus inference...", show_time=True):
-				# Load model assets (cached via @st.cache_resource)
-				model_assets = load_model_assets()
-				
-				# Perform ensemble prediction
-				survival_func, avg_rr, risk_status = cal_single_person_surv_func(
-					current_input_data,
-					model_assets
-				)
-				
-				# Generate high-resolution chart for the PDF report
-				chart_buffer = plot_survival_curve(
-					survival_func,
-					highlight_times=current_input_data.get('eval_times', [])
-				)
-				
-				# Compose the formal clinical PDF report
-				pdf_bytes = generate_report_pdf(
-					current_input_data,
-					survival_func,
-					avg_rr,
-					risk_status,
-					chart_buffer
+				# Plain-dict view for the prediction and report layers
+				input_dict = current_input_data.to_dict()
+
+				# Perform ensemble prediction; identical re-submissions hit
+				# the st.cache_data layer and return the previous result
+				# instantly (model assets are loaded inside, once per process)
+				survival_func, avg_rr, risk_status = cal_single_person_surv_func_cached(
+					input_dict
 				)
-				
-				# Update Session State with current inference outputs
+
+				# Update Session State with current inference outputs. The
+				# PDF report (matplotlib rasterization + fpdf2 serialization,
+				# the costliest step of this pipeline) is composed lazily in
+				# the export section, only when the user asks for it
 				st.session_state.inference_results = {
 					"survival_func": survival_func,
 					"avg_rr": avg_rr,
 					"risk_status": risk_status,
-					"pdf_bytes": pdf_bytes,
 				}
-				# Lock current inputs to sync UI with the generated report
-				st.session_state.frozen_params = current_input_data.copy()
+				# Invalidate any report prepared for the previous inputs
+				st.session_state.report_pdf = None
+				# Lock current inputs to sync UI with the generated report;
+				# the snapshot is immutable, so no defensive copy is needed
+				st.session_state.frozen_params = current_input_data
 	
 	# --- 6. Result Visualization & Export ---
 	if st.session_state.inference_results is not None:
@@ -112,7 +109,7 @@ def run_st_app() -> None:
 		# Render interactive clinical metrics cards
 		show_risk_metrics(
 			results.get("survival_func"),
-			eval_times=cached_data.get('eval_times')
+			eval_times=cached_data.eval_times
 		)
 		
 		st.divider()
@@ -128,21 +125,43 @@ def run_st_app() -> None:
 		# Render the interactive Altair survival trajectory
 		show_altair_survival_chart(
 			results.get("survival_func"),
-			highlight_times=cached_data.get('eval_times')
+			highlight_times=cached_data.eval_times
 		)
-		
+
 		# Dynamic filename generation for the PDF export
-		patient_id = cached_data.get('user_id')
+		patient_id = cached_data.user_id
 		file_timestamp = datetime.date.today()
 		if patient_id:
 			export_filename = f"Sarcopenia_Risk_Report_{patient_id}_{file_timestamp}.pdf"
 		else:
 			export_filename = f"Sarcopenia_Risk_Report_{file_timestamp}.pdf"
-		
+
+		# Lazy report composition: most assessments are read on screen and
+		# never exported, so the chart render and PDF serialization only run
+		# once the user requests the document. The result is held in session
+		# state until the inputs change, so preparing is a one-time cost.
+		pdf_bytes = st.session_state.get("report_pdf")
+		if pdf_bytes is None:
+			if st.button("🧾 Prepare Clinical Report (PDF)", type="primary"):
+				with st.spinner("Composing clinical report..."):
+					# High-resolution chart rendered for the document only
+					chart_buffer = plot_survival_curve(
+						results["survival_func"],
+						highlight_times=cached_data.eval_times
+					)
+					pdf_bytes = generate_report_pdf(
+						cached_data.to_dict(),
+						results["survival_func"],
+						results["avg_rr"],
+						results["risk_status"],
+						chart_buffer
+					)
+					st.session_state.report_pdf = pdf_bytes
+
 		# Provide PDF download capability without triggering a full script rerun
-		if st.download_button(
+		if pdf_bytes is not None and st.download_button(
 				label="📥 Download Clinical Report (PDF)",
-				data=results["pdf_bytes"],
+				data=pdf_bytes,
 				file_name=export_filename,
 				mime="application/pdf",
 				type="primary"